@@ -10,17 +10,69 @@ Converts JSON data to formatted Excel files.
 
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-from typing import Dict, Any, List
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+import xlsxwriter
+from typing import Dict, Any, BinaryIO, Iterator, Tuple, Union
 from io import BytesIO
 
 
+COLUMN_HEADERS = ("#", "Key", "Value", "Comments")
+
+# Named styles registered with openpyxl workbooks
+HEADER_STYLE = "Extracted Header"
+ROWNUM_STYLE = "Extracted Row Number"
+DATA_STYLE = "Extracted Data"
+
+COLUMN_WIDTHS = {
+    'A': 8,   # # (row number)
+    'B': 30,  # Key
+    'C': 50,  # Value
+    'D': 45,  # Comments
+}
+
+
+def _format_list(value: Union[list, tuple]) -> str:
+    """Join sequence items for a single cell."""
+    # Lists of strings join directly; anything else needs str() first
+    try:
+        return ", ".join(value)
+    except TypeError:
+        return ", ".join(map(str, value))
+
+
+def _format_dict(value: Dict[str, Any]) -> str:
+    """Render a mapping as "key: value" pairs for a single cell."""
+    # Don't include comments in the formatted value
+    return "; ".join(
+        f"{k}: {v}" for k, v in value.items() if k.lower() != "comments"
+    )
+
+
+# Exact-type dispatch for _format_value; parsed JSON only produces the
+# builtin container types, so subclasses do not need to be matched
+_VALUE_FORMATTERS = {
+    list: _format_list,
+    tuple: _format_list,
+    dict: _format_dict,
+}
+
+
 class ExcelWriter:
     """Converts structured JSON to Excel format."""
     
-    def __init__(self):
-        """Initialize Excel writer with formatting options."""
+    def __init__(self, engine: str = "xlsxwriter"):
+        """
+        Initialize Excel writer with formatting options.
+        
+        Args:
+            engine: Workbook backend, "xlsxwriter" (constant-memory, default)
+                or "openpyxl" (write-only mode)
+        """
+        if engine not in ("openpyxl", "xlsxwriter"):
+            raise ValueError(f"Unsupported Excel engine: {engine}")
+        self.engine = engine
+        
         self.header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
         self.header_font = Font(bold=True, color="FFFFFF", size=11)
         self.border = Border(
@@ -29,6 +81,25 @@ class ExcelWriter:
             top=Side(style='thin'),
             bottom=Side(style='thin')
         )
+        
+        # Shared style instances, assigned by reference to every streamed cell
+        self._header_align = Alignment(horizontal='center', vertical='center')
+        self._data_align = Alignment(vertical='top', wrap_text=True)
+        self._rownum_align = Alignment(horizontal='center', vertical='top')
+        
+        # Equivalent xlsxwriter format properties (formats are bound to a
+        # workbook, so they are registered once per json_to_excel call)
+        self._xlsx_header_format = {
+            'bold': True,
+            'font_color': '#FFFFFF',
+            'font_size': 11,
+            'bg_color': '#4472C4',
+            'align': 'center',
+            'valign': 'vcenter',
+            'border': 1,
+        }
+        self._xlsx_data_format = {'valign': 'top', 'text_wrap': True, 'border': 1}
+        self._xlsx_rownum_format = {'align': 'center', 'valign': 'top', 'border': 1}
     
     def json_to_excel(self, data: Dict[str, Any], output_path: str = None) -> BytesIO:
         """
@@ -41,59 +112,127 @@ class ExcelWriter:
         Returns:
             BytesIO object containing Excel file
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Extracted Data"
+        if self.engine == "xlsxwriter" and output_path:
+            # Let xlsxwriter assemble the file on disk, then load the result
+            # instead of holding the zip in memory while it is built
+            self.stream_to(data, output_path)
+            with open(output_path, 'rb') as f:
+                return BytesIO(f.read())
         
-        # Write header row: #, Key, Value, Comments
-        ws.append(["#", "Key", "Value", "Comments"])
-        self._format_header_row(ws, 1)
+        excel_buffer = BytesIO()
+        self.stream_to(data, excel_buffer)
+        excel_buffer.seek(0)
         
-        # Flatten data and write rows
-        row_number = 1
-        current_row = 2
+        # Optionally save to file, reusing the serialized bytes rather than
+        # building the workbook a second time (getbuffer avoids a copy)
+        if output_path:
+            with open(output_path, 'wb') as f:
+                f.write(excel_buffer.getbuffer())
         
-        for section_name, section_data in data.items():
-            rows = self._flatten_section(section_name, section_data)
-            
-            for row_data in rows:
-                key = row_data.get("key", "")
-                value = row_data.get("value", "")
-                comments = row_data.get("comments", "")
-                
-                ws.append([row_number, key, value, comments])
-                self._format_data_row(ws, current_row)
-                
-                row_number += 1
-                current_row += 1
+        return excel_buffer
+    
+    def stream_to(self, data: Dict[str, Any], fp: Union[str, BinaryIO]):
+        """
+        Write JSON data as an Excel file straight to a path or file-like object.
+        
+        Use this instead of json_to_excel when the destination is already a
+        file or response stream, so the workbook is not also held in a buffer.
+        
+        Args:
+            data: Extracted structured data
+            fp: File path or writable binary file-like object
+        """
+        if self.engine == "xlsxwriter":
+            self._write_xlsxwriter(data, fp)
+        else:
+            self._write_openpyxl(data, fp)
+    
+    def _write_openpyxl(self, data: Dict[str, Any], target: Union[str, BinaryIO]):
+        """Write the workbook to a path or file-like object using openpyxl write-only mode."""
+        # Write-only mode streams rows straight to XML instead of keeping
+        # every styled cell in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Extracted Data")
         
-        # Auto-adjust column widths
+        # Column widths must be set before the first row is appended
         self._adjust_column_widths(ws)
         
-        # Save to BytesIO
-        excel_buffer = BytesIO()
-        wb.save(excel_buffer)
-        excel_buffer.seek(0)
+        # Register each cell style with the workbook once as a named style;
+        # cells then reference it by name instead of re-hashing
+        # Font/Alignment/Border per cell
+        wb.add_named_style(self._named_style(HEADER_STYLE, self._header_align, header=True))
+        wb.add_named_style(self._named_style(ROWNUM_STYLE, self._rownum_align))
+        wb.add_named_style(self._named_style(DATA_STYLE, self._data_align))
         
-        # Optionally save to file
-        if output_path:
-            wb.save(output_path)
+        # Write header row: #, Key, Value, Comments
+        ws.append([self._styled_cell(ws, title, HEADER_STYLE) for title in COLUMN_HEADERS])
         
-        return excel_buffer
+        for row_number, key, value, comments in self._iter_rows(data):
+            ws.append((
+                self._styled_cell(ws, row_number, ROWNUM_STYLE),
+                self._styled_cell(ws, key, DATA_STYLE),
+                self._styled_cell(ws, value, DATA_STYLE),
+                self._styled_cell(ws, comments, DATA_STYLE),
+            ))
+        
+        wb.save(target)
     
-    def _flatten_section(self, section_name: str, section_data: Any) -> List[Dict[str, str]]:
+    def _write_xlsxwriter(self, data: Dict[str, Any], target: Union[str, BinaryIO]):
+        """Write the workbook to a path or file-like object using xlsxwriter in constant memory mode."""
+        wb = xlsxwriter.Workbook(target, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        header_format = wb.add_format(self._xlsx_header_format)
+        data_format = wb.add_format(self._xlsx_data_format)
+        rownum_format = wb.add_format(self._xlsx_rownum_format)
+        
+        # Columns only carry their width; formats go on the written cells so
+        # the borders stop at the last row instead of filling the sheet
+        ws = wb.add_worksheet("Extracted Data")
+        for col, width in COLUMN_WIDTHS.items():
+            ws.set_column(f"{col}:{col}", width)
+        
+        # Write header row: #, Key, Value, Comments
+        ws.write_row(0, 0, COLUMN_HEADERS, header_format)
+        
+        # write() turns empty strings into formatted blank cells, so an empty
+        # comment still gets its border
+        for row_number, key, value, comments in self._iter_rows(data):
+            ws.write_number(row_number, 0, row_number, rownum_format)
+            ws.write_row(row_number, 1, (key, value, comments), data_format)
+        
+        wb.close()
+    
+    def _iter_rows(self, data: Dict[str, Any]) -> Iterator[tuple]:
         """
-        Flatten a section into a list of rows.
+        Flatten all sections into numbered rows.
+        
+        Args:
+            data: Extracted structured data
+            
+        Yields:
+            Tuples of (row_number, key, value, comments)
+        """
+        row_number = 1
+        
+        for section_name, section_data in data.items():
+            for key, value, comments in self._iter_section(section_name, section_data):
+                yield (row_number, key, value, comments)
+                row_number += 1
+    
+    def _iter_section(self, section_name: str, section_data: Any) -> Iterator[Tuple[str, str, str]]:
+        """
+        Flatten a section into rows.
         
         Args:
             section_name: Name of the section
             section_data: Data for the section
             
-        Returns:
-            List of row dictionaries with key, value, comments
+        Yields:
+            Tuples of (key, value, comments)
         """
-        rows = []
-        
         if isinstance(section_data, dict):
             # Simple key-value section
             for key, value in section_data.items():
@@ -113,11 +252,7 @@ class ExcelWriter:
                 
                 formatted_value = self._format_value(value)
                 
-                rows.append({
-                    "key": key,
-                    "value": formatted_value,
-                    "comments": comment
-                })
+                yield (key, formatted_value, comment)
         
         elif isinstance(section_data, list):
             # List of items (e.g., education, work experience)
@@ -135,70 +270,43 @@ class ExcelWriter:
                         formatted_value = self._format_value(value)
                         
                         # Only add comment to the first key of each item
-                        rows.append({
-                            "key": key,
-                            "value": formatted_value,
-                            "comments": item_comment if first_key else ""
-                        })
+                        yield (key, formatted_value, item_comment if first_key else "")
                         first_key = False
                 else:
                     # Simple list item
-                    rows.append({
-                        "key": f"item_{idx + 1}",
-                        "value": str(item),
-                        "comments": ""
-                    })
+                    yield (f"item_{idx + 1}", str(item), "")
         else:
             # Simple value
-            rows.append({
-                "key": section_name,
-                "value": str(section_data),
-                "comments": ""
-            })
-        
-        return rows
+            yield (section_name, str(section_data), "")
     
     def _format_value(self, value: Any) -> str:
         """Format value for Excel cell."""
-        if isinstance(value, list):
-            return ", ".join(str(v) for v in value)
-        elif isinstance(value, dict):
-            # Don't include comments in the formatted value
-            filtered = {k: v for k, v in value.items() if k.lower() != "comments"}
-            if not filtered:
-                return ""
-            return "; ".join(f"{k}: {v}" for k, v in filtered.items())
-        else:
-            return str(value) if value is not None else ""
+        # Most leaf values are already plain strings
+        if type(value) is str:
+            return value
+        
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        return str(value) if value is not None else ""
     
-    def _format_header_row(self, ws, row_num: int):
-        """Apply formatting to header row."""
-        for cell in ws[row_num]:
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = self.border
+    def _named_style(self, name: str, alignment: Alignment, header: bool = False) -> NamedStyle:
+        """Build a named cell style; named styles bind to one workbook, so build one per workbook."""
+        style = NamedStyle(name=name, alignment=alignment, border=self.border)
+        if header:
+            style.font = self.header_font
+            style.fill = self.header_fill
+        return style
     
-    def _format_data_row(self, ws, row_num: int):
-        """Apply formatting to data row."""
-        for idx, cell in enumerate(ws[row_num]):
-            cell.border = self.border
-            cell.alignment = Alignment(vertical='top', wrap_text=True)
-            
-            # Center align the row number column
-            if idx == 0:  # First column is row number
-                cell.alignment = Alignment(horizontal='center', vertical='top')
+    def _styled_cell(self, ws, value: Any, style_name: str) -> WriteOnlyCell:
+        """Build a write-only cell that uses a registered named style."""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
     
     def _adjust_column_widths(self, ws):
         """Auto-adjust column widths based on content."""
-        column_widths = {
-            'A': 8,   # # (row number)
-            'B': 30,  # Key
-            'C': 50,  # Value
-            'D': 45,  # Comments
-        }
-        
-        for col, width in column_widths.items():
+        for col, width in COLUMN_WIDTHS.items():
             ws.column_dimensions[col].width = width
     
     def json_to_dataframe(self, data: Dict[str, Any]) -> pd.DataFrame:
@@ -211,19 +319,16 @@ class ExcelWriter:
         Returns:
             DataFrame representation
         """
-        rows = []
-        row_number = 1
+        # Build column arrays so pandas does not have to infer row structure
+        nums, keys, values, comments = [], [], [], []
         
-        for section_name, section_data in data.items():
-            flattened_rows = self._flatten_section(section_name, section_data)
-            
-            for row_data in flattened_rows:
-                rows.append({
-                    "#": row_number,
-                    "Key": row_data.get("key", ""),
-                    "Value": row_data.get("value", ""),
-                    "Comments": row_data.get("comments", "")
-                })
-                row_number += 1
+        for row_number, key, value, comment in self._iter_rows(data):
+            nums.append(row_number)
+            keys.append(key)
+            values.append(value)
+            comments.append(comment)
         
-        return pd.DataFrame(rows)
\ No newline at end of file
+        return pd.DataFrame(
+            {"#": nums, "Key": keys, "Value": values, "Comments": comments},
+            copy=False,
+        )
@@ -9,7 +9,10 @@ LangChain-based LLM extraction pipeline with retry logic.
 """
 
 import json
-from typing import Dict, Any, Optional
+import os
+from functools import lru_cache
+from itertools import batched
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
@@ -22,7 +25,47 @@ from tenacity import (
 )
 
 from .model_selector import ModelSelector
-from .schema import validate_json_structure, ValidationResult
+from .schema import validate_json_structure, ValidationResult, loads_json, strip_code_fence
+from .response_cache import ResponseCache
+
+
+# The prompt's closing paragraph asks for a single JSON object; in batch mode
+# it is replaced (from this marker onwards) by the array instruction below
+_SINGLE_OBJECT_INSTRUCTION = "CRITICAL: Return ONLY the JSON object."
+
+_BATCH_INSTRUCTIONS = """CRITICAL: The document content above contains {count} separate documents, each wrapped in <<DOC i=N>> and <<END>> markers. Apply all of the instructions above to each document independently. Return ONLY a JSON array containing exactly {count} JSON objects, one per document, in the same order as the documents. No preamble, no explanation, no markdown code blocks (do not wrap in ```json). Ensure the JSON is complete and properly closed with all braces, brackets and quotes terminated. The response must be valid, parseable JSON from start to finish.
+"""
+
+# Rough output size of one extracted document, used to fit a batch's answer
+# within the model's output token cap
+_OUTPUT_TOKENS_PER_DOCUMENT = 1500
+
+# Batch size used when the model does not expose its output token cap
+_DEFAULT_BATCH_SIZE = 2
+
+
+@lru_cache(maxsize=4)
+def _load_prompt_template(prompt_path: str, mtime: float) -> PromptTemplate:
+    """
+    Read and compile a prompt template, shared across extractor instances.
+    
+    The file's mtime is part of the cache key, so edits to the prompt are
+    picked up without clearing the cache.
+    """
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        prompt_text = f.read()
+    
+    return PromptTemplate(
+        template=prompt_text,
+        input_variables=["document_text"]
+    )
+
+
+def _cached_prompt_tokens(response: Any) -> int:
+    """Number of prompt tokens the provider served from its prompt cache."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    return details.get("cache_read") or 0
 
 
 class LLMExtractor:
@@ -33,6 +76,7 @@ class LLMExtractor:
         model_selector: ModelSelector,
         prompt_path: Optional[str] = None,
         max_retries: int = 3,
+        cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize extractor.
@@ -41,9 +85,11 @@ class LLMExtractor:
             model_selector: ModelSelector instance for LLM management
             prompt_path: Path to extraction prompt file
             max_retries: Maximum retry attempts for extraction
+            cache: Optional ResponseCache to skip the LLM for known documents
         """
         self.model_selector = model_selector
         self.max_retries = max_retries
+        self.cache = cache
         
         # Load extraction prompt
         if prompt_path:
@@ -59,13 +105,7 @@ class LLMExtractor:
     def _load_prompt(self, prompt_path: str) -> PromptTemplate:
         """Load prompt template from file."""
         try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                prompt_text = f.read()
-            
-            return PromptTemplate(
-                template=prompt_text,
-                input_variables=["document_text"]
-            )
+            return _load_prompt_template(prompt_path, os.path.getmtime(prompt_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
         except Exception as e:
@@ -89,6 +129,29 @@ class LLMExtractor:
         Raises:
             Exception: If extraction fails after all retries
         """
+        if self.cache is not None:
+            cached = self.cache.get(text)
+            if cached is not None:
+                print("Using cached extraction result")
+                return cached
+        
+        data = self._extract_with_fallback(text)
+        
+        if self.cache is not None:
+            self.cache.put(text, data)
+        
+        return data
+    
+    def _extract_with_fallback(self, text: str) -> Dict[str, Any]:
+        """
+        Extract with the current model, falling back to the other provider.
+        
+        Args:
+            text: Input text to extract from
+            
+        Returns:
+            Extracted structured data as dictionary
+        """
         # We treat failures (including empty/invalid JSON) as a signal to
         # optionally fall back to the other provider if available.
         try:
@@ -153,7 +216,26 @@ class LLMExtractor:
         formatted_prompt = self.prompt_template.format(document_text=text)
 
         # Invoke LLM
-        response = model.invoke(formatted_prompt)
+        content = self._invoke(model, model_type, formatted_prompt)
+
+        # Parse JSON
+        parsed_data = self._parse_json(content)
+
+        # Validate structure
+        validation = validate_json_structure(parsed_data)
+
+        if not validation.is_valid:
+            raise Exception(f"Validation failed: {', '.join(validation.errors)}")
+
+        return validation.data
+    
+    def _invoke(self, model: BaseChatModel, model_type: str, prompt: str) -> str:
+        """
+        Invoke the model and return the raw response text.
+
+        Also logs a short response preview and any provider prompt-cache reuse.
+        """
+        response = model.invoke(prompt)
 
         # Extract content
         if hasattr(response, "content"):
@@ -171,17 +253,146 @@ class LLMExtractor:
         except Exception:
             print(f"[{model_type}] LLM response preview unavailable")
 
-        # Parse JSON
-        parsed_data = self._parse_json(content)
+        # Everything in the prompt template before {document_text} (the
+        # extraction instructions) is byte-identical across calls, so that
+        # prefix is eligible for the providers' automatic prompt caching; the
+        # closing "CRITICAL: ..." paragraph follows the document and is not
+        # cached. Report any reuse.
+        cached_tokens = _cached_prompt_tokens(response)
+        if cached_tokens:
+            print(f"[{model_type}] Prompt cache hit: {cached_tokens} input tokens reused")
 
-        # Validate structure
-        validation = validate_json_structure(parsed_data)
+        return content
 
-        if not validation.is_valid:
-            raise Exception(f"Validation failed: {', '.join(validation.errors)}")
+    def extract_batch(self, docs: List[str], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract structured data from several documents, batching LLM calls.
+
+        Up to batch_size documents share one model invocation, so the fixed
+        instruction prompt is sent once per batch rather than once per
+        document. A batch whose response cannot be split into one valid
+        object per document is retried document by document.
+
+        Args:
+            docs: Input texts to extract from
+            batch_size: Maximum documents per model invocation (defaults to
+                as many results as fit in the model's output token cap)
+
+        Returns:
+            Extracted structured data for each document, in input order
+        """
+        if batch_size is None:
+            batch_size = self._default_batch_size()
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(docs)
+        pending = []
+
+        for i, doc in enumerate(docs):
+            cached = self.cache.get(doc) if self.cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        for chunk in batched(pending, batch_size):
+            texts = [docs[i] for i in chunk]
+            for i, data in zip(chunk, self._extract_chunk(texts)):
+                results[i] = data
+
+        return results
+
+    def _default_batch_size(self) -> int:
+        """Number of extraction results that fit in the model's output cap."""
+        # ChatOpenAI calls it max_tokens, ChatGoogleGenerativeAI max_output_tokens
+        for attr in ("max_tokens", "max_output_tokens"):
+            limit = getattr(self.model, attr, None)
+            if isinstance(limit, int):
+                return max(1, limit // _OUTPUT_TOKENS_PER_DOCUMENT)
+        return _DEFAULT_BATCH_SIZE
+
+    def _extract_chunk(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Extract one batch, falling back to per-document extraction on failure."""
+        if len(texts) == 1:
+            return [self.extract(texts[0])]
+
+        try:
+            results = self._run_batch_extraction_attempt(texts)
+        except Exception as e:
+            print(
+                f"Batch extraction of {len(texts)} documents failed: {str(e)}. "
+                "Falling back to per-document extraction..."
+            )
+            return [self.extract(text) for text in texts]
+
+        if self.cache is not None:
+            for text, data in zip(texts, results):
+                self.cache.put(text, data)
+
+        return results
+
+    def _run_batch_extraction_attempt(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run one model invocation covering several documents.
+
+        Documents are wrapped in numbered delimiters inside the regular
+        prompt, whose single-object closing instruction is swapped for one
+        asking for a JSON array.
+        """
+        document_text = "\n\n".join(
+            f"<<DOC i={i}>>\n{text}\n<<END>>" for i, text in enumerate(texts)
+        )
+        formatted_prompt = self.prompt_template.format(document_text=document_text)
+        batch_instructions = _BATCH_INSTRUCTIONS.format(count=len(texts))
+
+        # rpartition so a document quoting the marker is left untouched
+        head, marker, _ = formatted_prompt.rpartition(_SINGLE_OBJECT_INSTRUCTION)
+        if marker:
+            formatted_prompt = head + batch_instructions
+        else:
+            formatted_prompt = f"{formatted_prompt}\n\n{batch_instructions}"
+
+        content = self._invoke(self.model, self.model_type, formatted_prompt)
+        items = self._parse_json_array(content)
+
+        if len(items) != len(texts):
+            raise Exception(f"Expected {len(texts)} results, got {len(items)}")
+
+        results = []
+        for i, item in enumerate(items):
+            validation = validate_json_structure(item)
+            if not validation.is_valid:
+                raise Exception(
+                    f"Validation failed for document {i}: {', '.join(validation.errors)}"
+                )
+            results.append(validation.data)
+
+        return results
+
+    def _parse_json_array(self, content: str) -> List[Any]:
+        """
+        Parse a JSON array from a batch LLM response.
+
+        Args:
+            content: LLM response content
+
+        Returns:
+            Parsed list of per-document results
+        """
+        content = content.strip()
+
+        # Skip any markdown fence or preamble around the array
+        start_idx = content.find('[')
+        end_idx = content.rfind(']')
+        if start_idx == -1 or end_idx <= start_idx:
+            raise Exception("No JSON array found in batch LLM response. Response starts with: "
+                            f"{content[:200]!r}")
+
+        items = loads_json(content[start_idx:end_idx + 1])
+        if not isinstance(items, list):
+            raise Exception(f"Expected JSON array, got {type(items).__name__}")
+
+        return items
 
-        return validation.data
-    
     def _parse_json(self, content: str) -> Dict[str, Any]:
         """
         Parse JSON from LLM response with robust error handling.
@@ -200,31 +411,10 @@ class LLMExtractor:
             raise Exception("Empty LLM response: content is empty or whitespace."
                             " Check model availability, API keys, or prompt formatting.")
 
-        # Remove markdown code blocks (handle cases where closing ``` is missing)
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            
-            for line in lines:
-                stripped_line = line.strip()
-                if stripped_line.startswith("```"):
-                    if not in_json:
-                        in_json = True
-                        continue
-                    else:
-                        # Found closing ```
-                        break
-                if in_json:
-                    json_lines.append(line)
-            
-            # If we never found closing ```, use all lines after the first ```
-            if json_lines:
-                content = "\n".join(json_lines).strip()
-            else:
-                # Fallback: remove first line if it's ```json or ```
-                if lines and lines[0].strip().startswith("```"):
-                    content = "\n".join(lines[1:]).strip()
+        # Remove markdown code blocks (handles a missing closing ```)
+        fenced = strip_code_fence(content)
+        if fenced is not None:
+            content = fenced.strip()
 
         # Try to find JSON object boundaries
         start_idx = content.find('{')
@@ -278,7 +468,7 @@ class LLMExtractor:
 
         # Parse JSON
         try:
-            return json.loads(json_str)
+            return loads_json(json_str)
         except json.JSONDecodeError as e:
             # Try one more time with the original content after markdown removal
             try:
@@ -287,7 +477,7 @@ class LLMExtractor:
                 end_idx = content.rfind('}')
                 if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
                     json_str = content[start_idx:end_idx + 1]
-                    return json.loads(json_str)
+                    return loads_json(json_str)
             except json.JSONDecodeError:
                 pass
 
@@ -44,6 +44,10 @@ class ModelSelector:
         
         # Track which model is currently active
         self.current_model: Literal["openai", "gemini"] = "openai"
+        
+        # Constructed chat clients keyed by (provider, settings), so repeated
+        # lookups reuse the client and its HTTP connection pool
+        self._model_cache: dict[tuple, BaseChatModel] = {}
     
     def get_primary_model(self) -> BaseChatModel:
         """
@@ -61,15 +65,17 @@ class ModelSelector:
                 "Set OPENAI_API_KEY environment variable or pass it to constructor."
             )
         
+        config = {
+            "model": self.primary_model,
+            "api_key": self.openai_api_key,
+            "temperature": self.temperature,
+            "max_tokens": 4096,
+            "timeout": 60,
+            "max_retries": 2,
+        }
+        
         try:
-            model = ChatOpenAI(
-                model=self.primary_model,
-                api_key=self.openai_api_key,
-                temperature=self.temperature,
-                max_tokens=4096,
-                timeout=60,
-                max_retries=2,
-            )
+            model = self._cached_model("openai", ChatOpenAI, config)
             self.current_model = "openai"
             return model
         except Exception as e:
@@ -91,19 +97,30 @@ class ModelSelector:
                 "Set GOOGLE_API_KEY environment variable or pass it to constructor."
             )
         
+        config = {
+            "model": self.fallback_model,
+            "google_api_key": self.google_api_key,
+            "temperature": self.temperature,
+            "max_output_tokens": 8192,  # Increased to handle longer JSON responses
+            "timeout": 60,
+        }
+        
         try:
-            model = ChatGoogleGenerativeAI(
-                model=self.fallback_model,
-                google_api_key=self.google_api_key,
-                temperature=self.temperature,
-                max_output_tokens=8192,  # Increased to handle longer JSON responses
-                timeout=60,
-            )
+            model = self._cached_model("gemini", ChatGoogleGenerativeAI, config)
             self.current_model = "gemini"
             return model
         except Exception as e:
             raise Exception(f"Failed to initialize Gemini model: {str(e)}")
     
+    def _cached_model(self, provider: str, model_cls: type, config: dict) -> BaseChatModel:
+        """Return the client built for this provider and config, constructing it once."""
+        key = (provider, frozenset(config.items()))
+        model = self._model_cache.get(key)
+        if model is None:
+            model = model_cls(**config)
+            self._model_cache[key] = model
+        return model
+    
     def get_model_with_fallback(self) -> tuple[BaseChatModel, Literal["openai", "gemini"]]:
         """
         Get model with automatic fallback logic.
@@ -1,19 +1,43 @@
 """
 PDF Loader Module
-Extracts text from PDF files using pdfplumber with formatting preservation.
+Extracts text from PDF files using pypdfium2 or pdfplumber with formatting preservation.
 """
 
+import multiprocessing
+import os
 import pdfplumber
+import pypdfium2 as pdfium
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from io import BytesIO
 
 
+# PDFium is not thread-safe and pypdfium2 does not serialize calls itself.
+# Streamlit runs each session in its own thread (and the app loads PDFs in an
+# executor), so every PDFium call goes through this process-wide lock.
+_PDFIUM_LOCK = threading.Lock()
+
+
 class PDFLoader:
     """Loads and extracts text from PDF files."""
     
-    def __init__(self):
+    # Whitespace cleanup patterns, compiled once for all instances
+    _WS_RE = re.compile(r'[ \t]{2,}')
+    _NL_RE = re.compile(r'\n{3,}')
+    _LINE_TRIM_RE = re.compile(r'(?m)^[ \t]+|[ \t]+$')
+    
+    def __init__(self, use_pdfium: bool = True):
+        """
+        Initialize PDF loader.
+        
+        Args:
+            use_pdfium: Extract text with PDFium (native, fast). Set to False
+                to use pdfplumber's layout-aware extraction instead.
+        """
         self.max_pages = 2  # Limit to 1-2 pages as per requirements
+        self.use_pdfium = use_pdfium
     
     def load_from_bytes(self, pdf_bytes: bytes) -> str:
         """
@@ -26,11 +50,37 @@ class PDFLoader:
             Extracted and cleaned text
         """
         try:
+            if self.use_pdfium:
+                return self._join_pages(self._pdfium_page_texts(pdf_bytes))
             with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
                 return self._extract_text(pdf)
         except Exception as e:
             raise Exception(f"Failed to load PDF: {str(e)}")
     
+    def load_many(self, pdf_bytes_list: list[bytes], max_workers: Optional[int] = None) -> list[str]:
+        """
+        Load several PDFs in parallel worker processes.
+        
+        Args:
+            pdf_bytes_list: PDF files as bytes
+            max_workers: Worker process count (defaults to CPU count)
+            
+        Returns:
+            Extracted and cleaned text for each PDF, in input order
+        """
+        # Process startup outweighs the parsing work for a single file
+        if len(pdf_bytes_list) <= 1:
+            return [self.load_from_bytes(pdf_bytes) for pdf_bytes in pdf_bytes_list]
+        
+        # Never fork: the app is multi-threaded, and a child forked while
+        # another thread holds _PDFIUM_LOCK would inherit it locked
+        workers = min(len(pdf_bytes_list), max_workers or os.cpu_count() or 1)
+        mp_context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            return list(executor.map(self.load_from_bytes, pdf_bytes_list))
+    
     def load_from_path(self, pdf_path: str) -> str:
         """
         Load PDF from file path and extract text.
@@ -42,11 +92,78 @@ class PDFLoader:
             Extracted and cleaned text
         """
         try:
+            if self.use_pdfium:
+                return self._join_pages(self._pdfium_page_texts(pdf_path))
             with pdfplumber.open(pdf_path) as pdf:
                 return self._extract_text(pdf)
         except Exception as e:
             raise Exception(f"Failed to load PDF from path: {str(e)}")
     
+    def load_and_validate(self, pdf_bytes: bytes) -> str:
+        """
+        Validate PDF and extract its text, opening the document only once.
+        
+        Args:
+            pdf_bytes: PDF file as bytes
+            
+        Returns:
+            Extracted and cleaned text
+            
+        Raises:
+            ValueError: If the PDF cannot be processed
+        """
+        error = self._check_pdf_bytes(pdf_bytes)
+        if error:
+            raise ValueError(error)
+        
+        try:
+            if self.use_pdfium:
+                page_texts = self._pdfium_page_texts(pdf_bytes, check_page_count=True)
+            else:
+                with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+                    self._check_page_count(len(pdf.pages))
+                    page_texts = self._page_texts(pdf)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"PDF validation failed: {str(e)}")
+        
+        if not page_texts[0] or not page_texts[0].strip():
+            raise ValueError("PDF appears to be empty or contains only images")
+        
+        return self._join_pages(page_texts)
+    
+    def _check_pdf_bytes(self, pdf_bytes: bytes) -> Optional[str]:
+        """
+        Cheap structural check that rejects non-PDF or truncated uploads
+        before any PDF parser is started.
+        
+        Args:
+            pdf_bytes: PDF file as bytes
+            
+        Returns:
+            Error message, or None if the bytes look like a complete PDF
+        """
+        if not pdf_bytes:
+            return "PDF file is empty"
+        
+        # The spec allows the header anywhere in the first 1 KiB
+        if b"%PDF-" not in pdf_bytes[:1024]:
+            return "File is not a PDF (missing %PDF- header)"
+        
+        if b"%%EOF" not in pdf_bytes[-1024:]:
+            return "PDF file appears to be truncated (missing %%EOF marker)"
+        
+        return None
+    
+    def _check_page_count(self, page_count: int):
+        """Raise ValueError if the page count is outside the supported range."""
+        if page_count == 0:
+            raise ValueError("PDF has no pages")
+        
+        if page_count > self.max_pages:
+            raise ValueError(f"PDF has {page_count} pages. Maximum allowed is {self.max_pages}")
+    
     def _extract_text(self, pdf) -> str:
         """
         Extract text from PDF pages.
@@ -57,21 +174,83 @@ class PDFLoader:
         Returns:
             Cleaned and formatted text
         """
+        return self._join_pages(self._page_texts(pdf))
+    
+    def _pdfium_page_texts(self, source, check_page_count: bool = False) -> list[str]:
+        """
+        Open a document with PDFium and extract raw page text under the lock.
+        
+        Args:
+            source: PDF file as bytes, or a file path
+            check_page_count: Raise ValueError if the page count is unsupported
+            
+        Returns:
+            Raw text of each processed page
+        """
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                if check_page_count:
+                    self._check_page_count(len(pdf))
+                return self._page_texts_pdfium(pdf)
+            finally:
+                pdf.close()
+    
+    def _page_texts(self, pdf) -> list[Optional[str]]:
+        """
+        Extract raw text from the first 1-2 pages with pdfplumber.
+        
+        Args:
+            pdf: pdfplumber PDF object
+            
+        Returns:
+            Raw text of each processed page
+        """
         if len(pdf.pages) == 0:
             raise Exception("PDF has no pages")
         
-        # Extract text from first 1-2 pages
         pages_to_process = min(len(pdf.pages), self.max_pages)
+        return [pdf.pages[i].extract_text() for i in range(pages_to_process)]
+    
+    def _page_texts_pdfium(self, pdf) -> list[str]:
+        """
+        Extract raw text from the first 1-2 pages with PDFium.
+        
+        Must be called with _PDFIUM_LOCK held.
+        
+        Args:
+            pdf: pypdfium2 PdfDocument
+            
+        Returns:
+            Raw text of each processed page
+        """
+        if len(pdf) == 0:
+            raise Exception("PDF has no pages")
+        
+        pages_to_process = min(len(pdf), self.max_pages)
         text_parts = []
         
         for i in range(pages_to_process):
-            page = pdf.pages[i]
-            page_text = page.extract_text()
-            
-            if page_text:
-                text_parts.append(page_text)
+            page = pdf[i]
+            textpage = page.get_textpage()
+            # PDFium separates lines with CRLF
+            text_parts.append(textpage.get_text_bounded().replace('\r\n', '\n'))
+            textpage.close()
+            page.close()
+        
+        return text_parts
+    
+    def _join_pages(self, text_parts: list[str]) -> str:
+        """
+        Join per-page text and clean the result.
         
-        full_text = "\n\n".join(text_parts)
+        Args:
+            text_parts: Raw text of each extracted page
+            
+        Returns:
+            Cleaned and formatted text
+        """
+        full_text = "\n\n".join(text for text in text_parts if text)
         
         # Clean the text
         cleaned_text = self._clean_text(full_text)
@@ -92,17 +271,13 @@ class PDFLoader:
             Cleaned text
         """
         # Remove excessive whitespace but preserve line breaks
-        text = re.sub(r' +', ' ', text)
-        
-        # Remove more than 2 consecutive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = self._WS_RE.sub(' ', text)
         
         # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
+        text = self._LINE_TRIM_RE.sub('', text)
         
-        # Remove any remaining multiple spaces
-        text = re.sub(r'  +', ' ', text)
+        # Remove more than 2 consecutive newlines
+        text = self._NL_RE.sub('\n\n', text)
         
         return text.strip()
     
@@ -116,6 +291,10 @@ class PDFLoader:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        error = self._check_pdf_bytes(pdf_bytes)
+        if error:
+            return False, error
+        
         try:
             with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
                 if len(pdf.pages) == 0:
@@ -124,9 +303,9 @@ class PDFLoader:
                 if len(pdf.pages) > self.max_pages:
                     return False, f"PDF has {len(pdf.pages)} pages. Maximum allowed is {self.max_pages}"
                 
-                # Try to extract text from first page
-                page_text = pdf.pages[0].extract_text()
-                if not page_text or not page_text.strip():
+                # A page without character objects has no text layer; this
+                # skips the layout pass extract_text() would run
+                if not pdf.pages[0].chars:
                     return False, "PDF appears to be empty or contains only images"
                 
                 return True, None
@@ -0,0 +1,95 @@
+"""
+Response Cache Module
+Exact-match cache of LLM extraction results keyed by document text.
+"""
+
+import copy
+import hashlib
+import shelve
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class ResponseCache:
+    """
+    Caches extraction results so identical documents skip the LLM call.
+
+    Documents are keyed by a SHA-256 digest of their whitespace-normalized
+    text. Results are kept in an in-memory LRU and, when a path is given,
+    persisted to a shelve database so they survive restarts.
+
+    A cache should only be shared by extractors using the same prompt and
+    model configuration, since the key covers the document text only.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 256):
+        """
+        Initialize response cache.
+
+        Args:
+            path: Optional shelve database path for persistence
+            max_entries: Maximum number of results kept in memory
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(doc_text: str) -> str:
+        """Digest of the document text with whitespace runs collapsed."""
+        normalized = " ".join(doc_text.split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, doc_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            doc_text: Document text that was extracted
+
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        key = self.make_key(doc_text)
+
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+        elif self.path:
+            with shelve.open(self.path) as db:
+                result = db.get(key)
+            if result is not None:
+                self._remember(key, result)
+
+        # Hand out copies so callers cannot mutate the cached entry
+        return copy.deepcopy(result) if result is not None else None
+
+    def put(self, doc_text: str, result: Dict[str, Any]):
+        """
+        Store an extraction result.
+
+        Args:
+            doc_text: Document text that was extracted
+            result: Extracted structured data
+        """
+        key = self.make_key(doc_text)
+        result = copy.deepcopy(result)
+
+        self._remember(key, result)
+        if self.path:
+            with shelve.open(self.path) as db:
+                db[key] = result
+
+    def clear(self):
+        """Remove all cached results, including persisted ones."""
+        self._memory.clear()
+        if self.path:
+            with shelve.open(self.path) as db:
+                db.clear()
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        """Add to the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -9,8 +9,25 @@ Defines Pydantic models for structured data validation.
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+# Markdown code fence around a JSON payload. Any info string (```json,
+# ```JSON, ```) and CRLF line endings are accepted. The payload runs to the
+# last fence line, so trailing chatter after it is ignored; the closing fence
+# is optional so truncated responses are still unwrapped.
+_FENCE_RE = re.compile(
+    r'^\s*```[\w-]*[ \t]*\r?\n'
+    r'(?:(?P<closed>.*)\r?\n[ \t]*```.*|(?P<open>.*?)\s*)$',
+    re.DOTALL
+)
 
 
 class ExtractedData(BaseModel):
@@ -32,6 +49,10 @@ class ExtractedData(BaseModel):
     
     def to_json(self) -> str:
         """Convert to JSON string."""
+        if orjson is not None:
+            return orjson.dumps(
+                self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
         return json.dumps(self.data, indent=2, ensure_ascii=False)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -47,12 +68,41 @@ class ValidationResult(BaseModel):
     warnings: List[str] = Field(default_factory=list)
 
 
+def loads_json(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON string, using orjson when available.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def strip_code_fence(text: str) -> Optional[str]:
+    """
+    Extract the payload of a markdown code block.
+    
+    Args:
+        text: Text that may be wrapped in ``` or ```json fences
+        
+    Returns:
+        Text inside the fence, or None if the text is not fenced
+    """
+    fence_match = _FENCE_RE.match(text)
+    if not fence_match:
+        return None
+    closed = fence_match.group('closed')
+    return closed if closed is not None else fence_match.group('open')
+
+
 def validate_json_structure(data: Any) -> ValidationResult:
     """
     Validate JSON structure from LLM output.
     
     Args:
-        data: Data to validate (can be string or dict)
+        data: Data to validate (can be string, UTF-8 bytes or dict)
         
     Returns:
         ValidationResult with validation status and cleaned data
@@ -60,32 +110,19 @@ def validate_json_structure(data: Any) -> ValidationResult:
     errors = []
     warnings = []
     
-    # Handle string input (JSON string)
-    if isinstance(data, str):
+    # Handle string input (JSON string); bytes are parsed without decoding.
+    # Dicts from LLMExtractor skip this branch and are never re-serialized.
+    if isinstance(data, (str, bytes, bytearray)):
         try:
-            data = json.loads(data)
+            data = loads_json(data)
         except json.JSONDecodeError as e:
             # Try to extract JSON from markdown code blocks
-            data = data.strip()
-            if data.startswith("```"):
-                # Remove markdown code blocks
-                lines = data.split("\n")
-                # Find start and end of JSON
-                start_idx = 0
-                for i, line in enumerate(lines):
-                    if line.strip().startswith("```"):
-                        start_idx = i + 1
-                        break
-                
-                end_idx = len(lines)
-                for i in range(len(lines) - 1, start_idx, -1):
-                    if lines[i].strip().startswith("```"):
-                        end_idx = i
-                        break
-                
-                json_str = "\n".join(lines[start_idx:end_idx])
+            if not isinstance(data, str):
+                data = bytes(data).decode('utf-8', errors='replace')
+            fenced = strip_code_fence(data)
+            if fenced is not None:
                 try:
-                    data = json.loads(json_str)
+                    data = loads_json(fenced)
                 except json.JSONDecodeError:
                     errors.append(f"Failed to parse JSON: {str(e)}")
                     return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
@@ -103,7 +140,8 @@ def validate_json_structure(data: Any) -> ValidationResult:
         errors.append("Extracted data is empty")
         return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
     
-    # Validate nested structures
+    # Validate nested structures (strips whitespace from keys and string
+    # values; dict input needs this too, so it has no early return)
     cleaned_data = _clean_data(data)
     
     # Check for common issues
@@ -120,38 +158,38 @@ def validate_json_structure(data: Any) -> ValidationResult:
 
 def _clean_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Clean and normalize data structure.
+    Clean and normalize data structure in place.
+    
+    Walks nested dicts (including dicts inside lists) with an explicit
+    stack (no recursion) and strips whitespace from keys and string values.
     
     Args:
         data: Raw data dictionary
         
     Returns:
-        Cleaned data dictionary
+        The same dictionary, cleaned
     """
-    if not isinstance(data, dict):
-        return data
+    stack = [data]
     
-    cleaned = {}
-    
-    for key, value in data.items():
-        # Clean key
-        clean_key = key.strip()
+    while stack:
+        node = stack.pop()
         
-        # Recursively clean nested structures
-        if isinstance(value, dict):
-            cleaned[clean_key] = _clean_data(value)
-        elif isinstance(value, list):
-            cleaned[clean_key] = [
-                _clean_data(item) if isinstance(item, dict) else item
-                for item in value
-            ]
-        elif isinstance(value, str):
-            # Clean string values
-            cleaned[clean_key] = value.strip() if value else value
-        else:
-            cleaned[clean_key] = value
-    
-    return cleaned
+        # Rebuild each dict from a snapshot of its items: keys keep their
+        # order, and when several keys strip to the same name the last one
+        # wins, as with a freshly built dict
+        items = list(node.items())
+        node.clear()
+        for key, value in items:
+            if isinstance(value, str):
+                value = value.strip()
+            elif isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, list):
+                # Only dicts inside lists are cleaned; other items are kept as-is
+                stack.extend(item for item in value if isinstance(item, dict))
+            node[key.strip()] = value
+    
+    return data
 
 
 def merge_comments_column(data: Dict[str, Any]) -> Dict[str, Any]:
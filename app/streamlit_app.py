@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 import json
+import hashlib
 import traceback
 
 from pipeline.pdf_loader import PDFLoader
@@ -18,6 +19,95 @@ from pipeline.excel_writer import ExcelWriter
 # Load environment variables
 load_dotenv()
 
+# Bounds for the process-wide caches of per-upload results and per-config
+# model selectors, which are shared by all sessions and would otherwise grow
+# for the life of the server
+CACHE_MAX_ENTRIES = 64
+CACHE_TTL = "1h"
+
+
+@st.cache_resource
+def get_pdf_loader() -> PDFLoader:
+    """Get the process-wide PDF loader."""
+    return PDFLoader()
+
+
+@st.cache_resource
+def get_excel_writer() -> ExcelWriter:
+    """Get the process-wide Excel writer."""
+    return ExcelWriter()
+
+
+# Selectors hold the raw API keys and their chat clients, so they are bounded
+# like the data caches instead of living for the whole process
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def get_model_selector(
+    keys_digest: str,
+    primary_model: str,
+    fallback_model: str,
+    temperature: float,
+    _openai_key: str,
+    _google_key: str,
+) -> ModelSelector:
+    """
+    Get a cached ModelSelector for the given configuration.
+    
+    Underscore-prefixed arguments are not hashed by Streamlit, so the API
+    keys only take part in the cache key through keys_digest.
+    """
+    return ModelSelector(
+        openai_api_key=_openai_key if _openai_key else None,
+        google_api_key=_google_key if _google_key else None,
+        primary_model=primary_model,
+        fallback_model=fallback_model,
+        temperature=temperature
+    )
+
+
+def hash_api_keys(*keys: str) -> str:
+    """Digest API keys so they can be used in cache keys without storing them."""
+    digest = hashlib.blake2b()
+    for key in keys:
+        digest.update((key or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_bytes(data: bytes) -> str:
+    """Short content digest used to key cached extraction results."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def extract_pdf_text(pdf_digest: str, _pdf_bytes: bytes) -> str:
+    """
+    Validate a PDF and extract its text, cached by content digest.
+    
+    Raises:
+        ValueError: If the PDF cannot be processed (not cached)
+    """
+    return get_pdf_loader().load_and_validate(_pdf_bytes)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def extract_structured_data(
+    text_digest: str,
+    primary_model: str,
+    fallback_model: str,
+    temperature: float,
+    keys_digest: str,
+    _extractor: LLMExtractor,
+    _pdf_text: str,
+) -> tuple[dict, dict]:
+    """
+    Run LLM extraction, cached by text digest and model configuration.
+    
+    Returns:
+        Tuple of (extracted_data, model_info)
+    """
+    extracted_data = _extractor.extract(_pdf_text)
+    return extracted_data, _extractor.get_current_model_info()
+
 
 def initialize_session_state():
     """Initialize Streamlit session state."""
@@ -199,62 +289,64 @@ def extract_data(
     status_text = st.empty()
     
     try:
-        # Step 1: Load PDF
-        status_text.text("📄 Loading PDF...")
+        # Step 1: Load PDF and initialize models
+        status_text.text("📄 Loading PDF and initializing AI models...")
         progress_bar.progress(10)
         
-        pdf_loader = PDFLoader()
         pdf_bytes = uploaded_file.read()
+        keys_digest = hash_api_keys(openai_key, google_key)
+        
+        model_selector = get_model_selector(
+            keys_digest,
+            primary_model,
+            fallback_model,
+            temperature,
+            openai_key,
+            google_key
+        )
+        
+        # Check available models
+        available = model_selector.get_available_models()
+        st.info(f"🔧 Available models: {', '.join(available)}")
         
-        # Validate PDF
-        is_valid, error_msg = pdf_loader.validate_pdf(pdf_bytes)
-        if not is_valid:
-            st.error(f"❌ PDF Validation Failed: {error_msg}")
+        # Validate and extract text (cached by content digest)
+        try:
+            pdf_text = extract_pdf_text(hash_bytes(pdf_bytes), pdf_bytes)
+        except ValueError as e:
+            st.error(f"❌ PDF Validation Failed: {str(e)}")
             progress_bar.empty()
             status_text.empty()
             return
         
-        # Extract text
-        status_text.text("📝 Extracting text from PDF...")
-        progress_bar.progress(25)
+        # The prompt template and model clients are cached, so this is cheap
+        extractor = LLMExtractor(model_selector)
         
-        pdf_text = pdf_loader.load_from_bytes(pdf_bytes)
         st.session_state.pdf_text = pdf_text
         
-        # Step 2: Initialize models
-        status_text.text("🤖 Initializing AI models...")
-        progress_bar.progress(40)
-        
-        model_selector = ModelSelector(
-            openai_api_key=openai_key if openai_key else None,
-            google_api_key=google_key if google_key else None,
-            primary_model=primary_model,
-            fallback_model=fallback_model,
-            temperature=temperature
-        )
-        
-        # Check available models
-        available = model_selector.get_available_models()
-        st.info(f"🔧 Available models: {', '.join(available)}")
-        
-        # Step 3: Extract data
+        # Step 2: Extract data
         status_text.text("🧠 Extracting structured data with AI...")
         progress_bar.progress(55)
         
-        extractor = LLMExtractor(model_selector)
-        extracted_data = extractor.extract(pdf_text)
-        
-        model_info = extractor.get_current_model_info()
+        # Re-running on the same text and settings reuses the cached result
+        extracted_data, model_info = extract_structured_data(
+            hash_bytes(pdf_text.encode()),
+            primary_model,
+            fallback_model,
+            temperature,
+            keys_digest,
+            extractor,
+            pdf_text
+        )
         st.info(f"✅ Used model: {model_info['model_type'].upper()} - {model_info['model_name']}")
         
         # Store in session state
         st.session_state.extracted_data = extracted_data
         
-        # Step 4: Convert to Excel
+        # Step 3: Convert to Excel
         status_text.text("📊 Converting to Excel format...")
         progress_bar.progress(80)
         
-        excel_writer = ExcelWriter()
+        excel_writer = get_excel_writer()
         excel_buffer = excel_writer.json_to_excel(extracted_data)
         
         # Store in session state
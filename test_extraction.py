@@ -14,10 +14,10 @@ google_key = os.getenv('GOOGLE_API_KEY')
 prompt_path = Path('prompts/extraction_prompt.txt')
 prompt_text = prompt_path.read_text(encoding='utf-8')
 
-placeholder = "__DOCUMENT_TEXT_PLACEHOLDER__"
-prompt_text = prompt_text.replace("{document_text}", placeholder)
-prompt_text = prompt_text.replace("{", "{{").replace("}", "}}")
-prompt_text = prompt_text.replace(placeholder, "{document_text}")
+# Escape literal braces in one pass, keeping the {document_text} variable
+brace_escape = str.maketrans({"{": "{{", "}": "}}"})
+head, _, tail = prompt_text.partition("{document_text}")
+prompt_text = head.translate(brace_escape) + "{document_text}" + tail.translate(brace_escape)
 
 # Create template
 template = PromptTemplate(
@@ -3,6 +3,7 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
 from pathlib import Path
 from langchain_core.prompts import PromptTemplate
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -14,10 +15,10 @@ google_key = os.getenv('GOOGLE_API_KEY')
 prompt_path = Path('prompts/extraction_prompt.txt')
 prompt_text = prompt_path.read_text(encoding='utf-8')
 
-placeholder = "__DOCUMENT_TEXT_PLACEHOLDER__"
-prompt_text = prompt_text.replace("{document_text}", placeholder)
-prompt_text = prompt_text.replace("{", "{{").replace("}", "}}")
-prompt_text = prompt_text.replace(placeholder, "{document_text}")
+# Escape literal braces in one pass, keeping the {document_text} variable
+brace_escape = str.maketrans({"{": "{{", "}": "}}"})
+head, _, tail = prompt_text.partition("{document_text}")
+prompt_text = head.translate(brace_escape) + "{document_text}" + tail.translate(brace_escape)
 
 # Create template
 template = PromptTemplate(
@@ -42,25 +43,42 @@ configs = [
     {"temperature": 0.1, "timeout": 60},  # Without max_output_tokens
 ]
 
-for i, config in enumerate(configs):
-    print(f"\n--- Test {i+1}: {config} ---")
-    try:
-        model = ChatGoogleGenerativeAI(
-            model='gemini-2.0-flash',
-            google_api_key=google_key,
-            **config
-        )
-        
-        response = model.invoke(formatted_prompt)
+
+async def run_config(config):
+    """Build a model for one config and request the extraction asynchronously."""
+    model = ChatGoogleGenerativeAI(
+        model='gemini-2.0-flash',
+        google_api_key=google_key,
+        **config
+    )
+    return await model.ainvoke(formatted_prompt)
+
+
+async def main():
+    # The requests are network-bound, so run every config concurrently
+    results = await asyncio.gather(
+        *(run_config(config) for config in configs),
+        return_exceptions=True
+    )
+
+    for i, (config, response) in enumerate(zip(configs, results)):
+        print(f"\n--- Test {i+1}: {config} ---")
+        if isinstance(response, Exception):
+            print(f"✗ Error: {type(response).__name__}: {str(response)}")
+            continue
+
         content = response.content if hasattr(response, 'content') else str(response)
-        
+
         print(f"✓ Content length: {len(content)}")
+        usage = getattr(response, 'usage_metadata', None) or {}
+        cached = (usage.get('input_token_details') or {}).get('cache_read', 0)
+        print(f"✓ Cached prompt tokens: {cached}/{usage.get('input_tokens', 0)}")
         if content:
             print(f"✓ First 300 chars:\n{content[:300]}")
         else:
             print("✗ EMPTY RESPONSE")
             print(f"Response object: {response}")
             print(f"Response attrs: {dir(response)}")
-            
-    except Exception as e:
-        print(f"✗ Error: {type(e).__name__}: {str(e)}")
+
+
+asyncio.run(main())
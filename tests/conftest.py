@@ -0,0 +1,126 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import pytest
+from unittest.mock import Mock
+from app.pipeline.excel_writer import ExcelWriter
+from app.pipeline.extractor import LLMExtractor
+from app.pipeline.pdf_loader import PDFLoader
+
+
+def make_pdf(pages: list[list[str]]) -> bytes:
+    """
+    Build a minimal text PDF in memory.
+    
+    Args:
+        pages: Lines of text for each page
+        
+    Returns:
+        PDF file as bytes
+    """
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page/content pair per page
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, lines in enumerate(pages):
+        content = (
+            "BT /F1 10 Tf 72 760 Td 14 TL "
+            + " ".join(f"({line}) '" for line in lines)
+            + " ET"
+        ).encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref_offset
+    )
+    return bytes(pdf)
+
+
+class _StubSelector:
+    """
+    Minimal stand-in for ModelSelector.
+    
+    Hands out a single mock OpenAI model and reports no fallback keys, so
+    extraction failures surface instead of switching providers.
+    """
+    
+    primary_model = "gpt-4o"
+    fallback_model = "gemini-2.5-flash"
+    
+    def __init__(self):
+        self.model = Mock()
+    
+    def get_model_with_fallback(self):
+        return self.model, "openai"
+    
+    def get_primary_model(self):
+        return self.model
+    
+    def get_fallback_model(self):
+        return self.model
+    
+    def validate_api_keys(self):
+        return {"openai": True, "gemini": False}
+
+
+@pytest.fixture
+def stub_selector():
+    """Fresh stub selector for tests that configure the returned model."""
+    return _StubSelector()
+
+
+# Session-scoped instances are shared by every test, so only use them in
+# tests that do not configure or mutate the object (e.g. its mock model)
+
+@pytest.fixture(scope="session")
+def extractor():
+    """Shared LLMExtractor backed by a stub model selector."""
+    return LLMExtractor(_StubSelector())
+
+
+@pytest.fixture(scope="session")
+def excel_writer():
+    """Shared ExcelWriter with the default engine."""
+    return ExcelWriter()
+
+
+@pytest.fixture(scope="session")
+def pdf_loader():
+    """Shared PDFLoader with default settings."""
+    return PDFLoader()
+
+
+@pytest.fixture(scope="session")
+def pdf_factory():
+    """Builder for in-memory PDFs with custom page text."""
+    return make_pdf
+
+
+@pytest.fixture(scope="session")
+def one_page_pdf():
+    """Single-page text PDF."""
+    return make_pdf([["Name:   John Doe", "Email: john@example.com"]])
+
+
+@pytest.fixture(scope="session")
+def three_page_pdf():
+    """Text PDF with one page more than PDFLoader accepts."""
+    return make_pdf([[f"Page {i}"] for i in range(1, 4)])
@@ -3,41 +3,35 @@ Tests for Excel Writer module
 """
 
 import pytest
+from openpyxl import load_workbook
 from app.pipeline.excel_writer import ExcelWriter
 
 
 class TestExcelWriter:
     """Test suite for ExcelWriter class."""
     
-    def test_initialization(self):
+    def test_initialization(self, excel_writer):
         """Test ExcelWriter initialization."""
-        writer = ExcelWriter()
-        assert writer.header_fill is not None
-        assert writer.header_font is not None
+        assert excel_writer.header_fill is not None
+        assert excel_writer.header_font is not None
     
-    def test_format_value_list(self):
+    def test_format_value_list(self, excel_writer):
         """Test value formatting for lists."""
-        writer = ExcelWriter()
-        
         value = ["Python", "Java", "JavaScript"]
-        formatted = writer._format_value(value)
+        formatted = excel_writer._format_value(value)
         
         assert formatted == "Python, Java, JavaScript"
     
-    def test_format_value_dict(self):
+    def test_format_value_dict(self, excel_writer):
         """Test value formatting for dictionaries."""
-        writer = ExcelWriter()
-        
         value = {"skill": "Python", "level": "Expert"}
-        formatted = writer._format_value(value)
+        formatted = excel_writer._format_value(value)
         
         assert "skill: Python" in formatted
         assert "level: Expert" in formatted
     
-    def test_json_to_excel_basic(self):
+    def test_json_to_excel_basic(self, excel_writer):
         """Test basic JSON to Excel conversion."""
-        writer = ExcelWriter()
-        
         data = {
             "Basic Details": {
                 "name": "John Doe",
@@ -45,7 +39,52 @@ class TestExcelWriter:
             }
         }
         
-        excel_buffer = writer.json_to_excel(data)
+        excel_buffer = excel_writer.json_to_excel(data)
         
         assert excel_buffer is not None
         assert excel_buffer.getvalue()  # Check buffer has content
+    
+    def test_json_to_excel_rows(self, excel_writer):
+        """Test streamed workbook contains the flattened rows."""
+        data = {
+            "Basic Details": {
+                "name": "John Doe",
+                "email": {"text": "john@example.com", "comments": "Work email"}
+            },
+            "Skills": ["Python", "SQL"]
+        }
+        
+        ws = load_workbook(excel_writer.json_to_excel(data)).active
+        rows = list(ws.iter_rows(values_only=True))
+        
+        assert ws.title == "Extracted Data"
+        assert rows[0] == ("#", "Key", "Value", "Comments")
+        assert rows[1] == (1, "name", "John Doe", None)
+        assert rows[2] == (2, "email", "john@example.com", "Work email")
+        assert rows[3] == (3, "item_1", "Python", None)
+        assert ws["A1"].font.b
+    
+    def test_json_to_excel_openpyxl_engine(self):
+        """Test JSON to Excel conversion with the openpyxl engine."""
+        writer = ExcelWriter(engine="openpyxl")
+        
+        data = {
+            "Basic Details": {
+                "name": "John Doe",
+                "email": "john@example.com"
+            }
+        }
+        
+        excel_buffer = writer.json_to_excel(data)
+        
+        assert excel_buffer.getvalue().startswith(b"PK")  # xlsx is a zip archive
+    
+    def test_stream_to_file(self, excel_writer, tmp_path):
+        """Test writing the workbook straight to an open file."""
+        output_file = tmp_path / "out.xlsx"
+        
+        with open(output_file, "wb") as f:
+            excel_writer.stream_to({"Basic Details": {"name": "John Doe"}}, f)
+        
+        rows = list(load_workbook(output_file).active.iter_rows(values_only=True))
+        assert rows[1] == (1, "name", "John Doe", None)
@@ -5,43 +5,90 @@ Tests for LLM Extractor module
 import pytest
 from unittest.mock import Mock, patch
 from app.pipeline.extractor import LLMExtractor
-from app.pipeline.model_selector import ModelSelector
+from app.pipeline.response_cache import ResponseCache
 
 
 class TestLLMExtractor:
     """Test suite for LLMExtractor class."""
     
-    @pytest.fixture
-    def mock_model_selector(self):
-        """Create a mock ModelSelector."""
-        selector = Mock(spec=ModelSelector)
-        selector.get_model_with_fallback.return_value = (Mock(), "openai")
-        return selector
-    
-    def test_parse_json_valid(self, mock_model_selector):
+    def test_parse_json_valid(self, extractor):
         """Test JSON parsing with valid input."""
-        extractor = LLMExtractor(mock_model_selector)
-        
         json_str = '{"name": "John", "age": 30}'
         result = extractor._parse_json(json_str)
         
         assert result == {"name": "John", "age": 30}
     
-    def test_parse_json_with_markdown(self, mock_model_selector):
+    def test_parse_json_with_markdown(self, extractor):
         """Test JSON parsing with markdown code blocks."""
-        extractor = LLMExtractor(mock_model_selector)
-        
         json_str = '```json\n{"name": "John", "age": 30}\n```'
         result = extractor._parse_json(json_str)
         
         assert result == {"name": "John", "age": 30}
     
-    def test_get_current_model_info(self, mock_model_selector):
+    def test_get_current_model_info(self, extractor):
         """Test getting current model information."""
-        extractor = LLMExtractor(mock_model_selector)
-        
         info = extractor.get_current_model_info()
         
         assert "model_type" in info
         assert "model_name" in info
-
+    
+    def test_prompt_template_shared(self, stub_selector):
+        """Test the compiled prompt template is reused across extractors."""
+        first = LLMExtractor(stub_selector)
+        second = LLMExtractor(stub_selector)
+        
+        assert first.prompt_template is second.prompt_template
+    
+    def test_extract_uses_cache(self, stub_selector):
+        """Test cached documents skip the LLM call."""
+        cache = ResponseCache()
+        cache.put("John Doe", {"name": "John Doe"})
+        extractor = LLMExtractor(stub_selector, cache=cache)
+        
+        result = extractor.extract("John Doe")
+        
+        assert result == {"name": "John Doe"}
+        extractor.model.invoke.assert_not_called()
+    
+    def test_extract_batch_single_call(self, stub_selector):
+        """Test several documents are extracted with one model call."""
+        extractor = LLMExtractor(stub_selector)
+        extractor.model.invoke.return_value = Mock(
+            content='[{"name": "John"}, {"name": "Jane"}]',
+            usage_metadata=None
+        )
+        
+        results = extractor.extract_batch(["John's resume", "Jane's resume"])
+        
+        assert results == [{"name": "John"}, {"name": "Jane"}]
+        assert extractor.model.invoke.call_count == 1
+    
+    def test_extract_batch_falls_back_per_document(self, stub_selector):
+        """Test a malformed batch response is retried per document."""
+        extractor = LLMExtractor(stub_selector)
+        extractor.model.invoke.side_effect = [
+            Mock(content='[{"name": "John"}]', usage_metadata=None),
+            Mock(content='{"name": "John"}', usage_metadata=None),
+            Mock(content='{"name": "Jane"}', usage_metadata=None),
+        ]
+        
+        results = extractor.extract_batch(["John's resume", "Jane's resume"])
+        
+        assert results == [{"name": "John"}, {"name": "Jane"}]
+        assert extractor.model.invoke.call_count == 3
+    
+    def test_extract_batch_sized_to_output_cap(self, stub_selector):
+        """Test batches are split to fit the model's output token cap."""
+        extractor = LLMExtractor(stub_selector)
+        extractor.model.max_tokens = 3000
+        extractor.model.invoke.return_value = Mock(
+            content='[{"name": "John"}, {"name": "Jane"}]',
+            usage_metadata=None
+        )
+        
+        extractor.extract_batch(["a", "b", "c", "d"])
+        
+        prompt = extractor.model.invoke.call_args[0][0]
+        assert extractor.model.invoke.call_count == 2
+        assert "Return ONLY the JSON object" not in prompt
+        assert "JSON array containing exactly 2 JSON objects" in prompt
@@ -46,6 +46,35 @@ class TestModelSelector:
         assert len(models) == 2
         assert any("OpenAI" in m for m in models)
         assert any("Gemini" in m for m in models)
+    
+    def test_available_models_follow_key_changes(self):
+        """Test availability follows the current API key attributes."""
+        selector = ModelSelector(
+            openai_api_key="test-key",
+            google_api_key="test-key"
+        )
+        assert len(selector.get_available_models()) == 2
+        
+        selector.openai_api_key = ""
+        
+        assert selector.validate_api_keys()["openai"] is False
+        assert selector.get_available_models() == [f"Gemini: {selector.fallback_model}"]
+    
+    def test_models_are_reused(self):
+        """Test repeated lookups return the same client until settings change."""
+        selector = ModelSelector(
+            openai_api_key="test-key",
+            google_api_key="test-key"
+        )
+        
+        with patch("app.pipeline.model_selector.ChatOpenAI") as mock_cls:
+            first = selector.get_primary_model()
+            assert selector.get_primary_model() is first
+            assert mock_cls.call_count == 1
+            
+            selector.temperature = 0.5
+            selector.get_primary_model()
+            assert mock_cls.call_count == 2
 
 
 # Run tests with: pytest tests/ -v
\ No newline at end of file
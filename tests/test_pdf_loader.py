@@ -10,24 +10,71 @@ from app.pipeline.pdf_loader import PDFLoader
 class TestPDFLoader:
     """Test suite for PDFLoader class."""
     
-    def test_initialization(self):
+    def test_initialization(self, pdf_loader):
         """Test PDFLoader initialization."""
-        loader = PDFLoader()
-        assert loader.max_pages == 2
+        assert pdf_loader.max_pages == 2
+        assert pdf_loader.use_pdfium
     
-    def test_clean_text(self):
+    def test_clean_text(self, pdf_loader):
         """Test text cleaning functionality."""
-        loader = PDFLoader()
-        
         # Test excessive whitespace removal
         dirty_text = "Hello    World\n\n\n\nTest"
-        clean_text = loader._clean_text(dirty_text)
+        clean_text = pdf_loader._clean_text(dirty_text)
         assert "    " not in clean_text
         assert "\n\n\n" not in clean_text
     
-    def test_validate_pdf_invalid_empty(self):
+    def test_validate_pdf_invalid_empty(self, pdf_loader):
         """Test PDF validation with empty bytes."""
-        loader = PDFLoader()
-        is_valid, error = loader.validate_pdf(b"")
+        is_valid, error = pdf_loader.validate_pdf(b"")
         assert not is_valid
         assert error is not None
+    
+    def test_load_and_validate_invalid_empty(self, pdf_loader):
+        """Test combined load/validation with empty bytes."""
+        with pytest.raises(ValueError):
+            pdf_loader.load_and_validate(b"")
+    
+    def test_load_many_empty(self, pdf_loader):
+        """Test batch loading with no files."""
+        assert pdf_loader.load_many([]) == []
+    
+    def test_load_many_preserves_order(self, pdf_loader, pdf_factory):
+        """Test batch loading in worker processes returns input order."""
+        pdfs = [pdf_factory([[f"Document {i}"]]) for i in range(3)]
+        
+        texts = pdf_loader.load_many(pdfs, max_workers=2)
+        
+        assert texts == ["Document 0", "Document 1", "Document 2"]
+    
+    def test_validate_pdf_invalid_header(self, pdf_loader):
+        """Test PDF validation rejects bytes without a PDF header."""
+        is_valid, error = pdf_loader.validate_pdf(b"<html></html>")
+        assert not is_valid
+        assert "header" in error
+    
+    @pytest.mark.parametrize("use_pdfium", [True, False])
+    def test_load_and_validate_text(self, one_page_pdf, use_pdfium):
+        """Test text extraction from a real PDF with both backends."""
+        loader = PDFLoader(use_pdfium=use_pdfium)
+        
+        text = loader.load_and_validate(one_page_pdf)
+        
+        assert text == loader.load_from_bytes(one_page_pdf)
+        assert "Name: John Doe" in text
+        assert "Email: john@example.com" in text
+    
+    @pytest.mark.parametrize("use_pdfium", [True, False])
+    def test_load_and_validate_page_limit(self, three_page_pdf, use_pdfium):
+        """Test PDFs over the page limit are rejected."""
+        loader = PDFLoader(use_pdfium=use_pdfium)
+        
+        with pytest.raises(ValueError, match="3 pages"):
+            loader.load_and_validate(three_page_pdf)
+    
+    def test_validate_pdf_real(self, pdf_loader, one_page_pdf, three_page_pdf):
+        """Test validate_pdf on accepted and oversized PDFs."""
+        assert pdf_loader.validate_pdf(one_page_pdf) == (True, None)
+        
+        is_valid, error = pdf_loader.validate_pdf(three_page_pdf)
+        assert not is_valid
+        assert "Maximum allowed is 2" in error
@@ -0,0 +1,47 @@
+"""
+Tests for Response Cache module
+"""
+
+import pytest
+from app.pipeline.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache class."""
+    
+    def test_get_miss(self):
+        """Test lookup of an unknown document."""
+        cache = ResponseCache()
+        assert cache.get("John Doe") is None
+    
+    def test_put_and_get_normalizes_whitespace(self):
+        """Test cached results are found regardless of whitespace layout."""
+        cache = ResponseCache()
+        cache.put("John   Doe\nEngineer", {"name": "John Doe"})
+        
+        assert cache.get("John Doe Engineer") == {"name": "John Doe"}
+    
+    def test_get_returns_copy(self):
+        """Test callers cannot mutate the cached entry."""
+        cache = ResponseCache()
+        cache.put("John Doe", {"name": "John Doe"})
+        
+        cache.get("John Doe")["name"] = "changed"
+        
+        assert cache.get("John Doe") == {"name": "John Doe"}
+    
+    def test_eviction(self):
+        """Test least recently used entries are evicted."""
+        cache = ResponseCache(max_entries=1)
+        cache.put("first", {"a": 1})
+        cache.put("second", {"b": 2})
+        
+        assert cache.get("first") is None
+        assert cache.get("second") == {"b": 2}
+    
+    def test_persistence(self, tmp_path):
+        """Test results persist across cache instances."""
+        path = str(tmp_path / "responses")
+        ResponseCache(path=path).put("John Doe", {"name": "John Doe"})
+        
+        assert ResponseCache(path=path).get("John Doe") == {"name": "John Doe"}
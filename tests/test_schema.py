@@ -4,6 +4,7 @@ Tests for Schema validation module
 """
 
 import pytest
+from unittest.mock import patch
 from app.pipeline.schema import validate_json_structure, ValidationResult
 
 
@@ -42,3 +43,50 @@ class TestSchemaValidation:
         
         assert not result.is_valid
         assert len(result.errors) > 0
+    
+    def test_validate_json_string_with_markdown(self):
+        """Test validation with JSON wrapped in a markdown code block."""
+        data = '```json\n{"name": "John", "age": 30}\n```'
+        result = validate_json_structure(data)
+        
+        assert result.is_valid
+        assert result.data == {"name": "John", "age": 30}
+    
+    @pytest.mark.parametrize("data", [
+        '```JSON\n{"name": "John", "age": 30}\n```',
+        '```json\r\n{"name": "John", "age": 30}\r\n```',
+        '```json\n{"name": "John", "age": 30}\n```\nHope this helps',
+    ])
+    def test_validate_json_fence_variants(self, data):
+        """Test fenced JSON with an uppercase tag, CRLF, or trailing text."""
+        result = validate_json_structure(data)
+        
+        assert result.is_valid
+        assert result.data == {"name": "John", "age": 30}
+    
+    def test_validate_json_bytes(self):
+        """Test validation with UTF-8 encoded JSON bytes."""
+        data = '{"name": "Jöhn", "age": 30}'.encode("utf-8")
+        result = validate_json_structure(data)
+        
+        assert result.is_valid
+        assert result.data["name"] == "Jöhn"
+    
+    def test_validate_dict_skips_parsing(self):
+        """Test dict input is validated without a JSON round-trip."""
+        data = {"name": "John", "age": 30}
+        
+        with patch("app.pipeline.schema.loads_json") as mock_loads:
+            result = validate_json_structure(data)
+        
+        assert result.is_valid
+        assert result.data == {"name": "John", "age": 30}
+        mock_loads.assert_not_called()
+    
+    def test_validate_strips_keys_last_wins(self):
+        """Test keys stripping to the same name keep the last value."""
+        data = {" a": 1, "a": 2, "b": [{" c ": " x "}, " y "]}
+        result = validate_json_structure(data)
+        
+        assert result.data == {"a": 2, "b": [{"c": "x"}, " y "]}
+        assert list(result.data) == ["a", "b"]